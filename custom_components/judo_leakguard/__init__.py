@@ -6,13 +6,12 @@ from datetime import datetime
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
 import homeassistant.helpers.aiohttp_client as hass_aiohttp
 
-from .api import AbsenceWindow, JudoApiClient
+from .api import AbsenceWindow, JudoApiClient, JudoApiError
 from .const import (
     CONF_HOST,
     CONF_PASSWORD,
@@ -60,7 +59,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         session=session,
     )
 
-    coordinator = JudoDataUpdateCoordinator(hass, client)
+    coordinator = JudoDataUpdateCoordinator(hass, client, entry)
     await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
@@ -70,31 +69,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # ── Services registrieren ──────────────────────────────────────────────
 
     async def handle_set_absence_schedule(call: ServiceCall) -> None:
-        window = AbsenceWindow(
-            index=call.data["index"],
-            start_day=call.data["start_day"],
-            start_hour=call.data["start_hour"],
-            start_minute=call.data["start_minute"],
-            stop_day=call.data["stop_day"],
-            stop_hour=call.data["stop_hour"],
-            stop_minute=call.data["stop_minute"],
-        )
+        # Schema-Keys entsprechen exakt den Feldern von AbsenceWindow
+        window = AbsenceWindow(**call.data)
         try:
             await client.write_absence_schedule(window)
-        except Exception as exc:
+        except JudoApiError as exc:
             raise HomeAssistantError(str(exc)) from exc
 
     async def handle_clear_absence_schedule(call: ServiceCall) -> None:
         try:
             await client.delete_absence_schedule(call.data["index"])
-        except Exception as exc:
+        except JudoApiError as exc:
             raise HomeAssistantError(str(exc)) from exc
 
     async def handle_set_datetime(call: ServiceCall) -> None:
         dt: datetime = call.data["datetime"]
         try:
             await client.set_datetime(dt)
-        except Exception as exc:
+        except JudoApiError as exc:
             raise HomeAssistantError(str(exc)) from exc
 
     if not hass.services.has_service(DOMAIN, SERVICE_SET_ABSENCE_SCHEDULE):
@@ -4,16 +4,30 @@ from __future__ import annotations
 import asyncio
 import logging
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any
 
 import aiohttp
 
 _LOGGER = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+
 # Maximale Retries bei HTTP 429
 _MAX_RETRIES = 3
 _RETRY_DELAY = 2.0  # Sekunden (mindestens 2 s laut Spezifikation)
+# Gesamt-Timeout pro Anfrage; einmalig angelegt statt bei jedem Request
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# Teilabfragen von get_status – Reihenfolge wie die zurückgegebenen Fehler
+STATUS_LEGS: tuple[str, ...] = (
+    "Gesamtwasser",
+    "Schlafdauer",
+    "Lernstatus",
+    "Mikroleck-Modus",
+    "Abwesenheitslimits",
+    "Gerätezeit",
+)
 
 
 # ── Hex-Hilfsfunktionen ───────────────────────────────────────────────────────
@@ -62,14 +76,33 @@ def from_u32_be(data: bytes, offset: int = 0) -> int:
     )
 
 
-def hex_to_bytes(hex_str: str) -> bytes:
-    """Wandelt einen Hex-String in Bytes um."""
-    return bytes.fromhex(hex_str)
+def hex_to_bytes(hex_str: str, min_len: int = 0) -> bytes:
+    """Wandelt einen Hex-String in Bytes um (mindestens ``min_len`` Bytes).
+
+    Ungültige oder zu kurze Gerätedaten werden als JudoApiError gemeldet.
+    """
+    try:
+        data = bytes.fromhex(hex_str)
+    except ValueError as exc:
+        raise JudoApiError(f"Ungültige Hex-Daten: {hex_str!r}") from exc
+    if len(data) < min_len:
+        raise JudoApiError(
+            f"Antwort zu kurz ({len(data)} statt {min_len} Bytes): {hex_str!r}"
+        )
+    return data
+
+
+def hex_to_int(hex_str: str) -> int:
+    """Wandelt einen Hex-String in eine Ganzzahl um."""
+    try:
+        return int(hex_str, 16)
+    except ValueError as exc:
+        raise JudoApiError(f"Ungültige Hex-Daten: {hex_str!r}") from exc
 
 
 # ── Datenmodelle ──────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class DeviceInfo:
     device_type: int
     serial_number: int
@@ -77,7 +110,7 @@ class DeviceInfo:
     commission_date: datetime | None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceStatus:
     total_water_liters: int
     sleep_hours: int
@@ -90,7 +123,7 @@ class DeviceStatus:
     device_datetime: datetime | None
 
 
-@dataclass
+@dataclass(slots=True)
 class AbsenceWindow:
     index: int
     start_day: int    # 0=So..6=Sa
@@ -143,7 +176,7 @@ class JudoApiClient:
                     async with self._session.get(
                         url,
                         auth=self._auth,
-                        timeout=aiohttp.ClientTimeout(total=10),
+                        timeout=_REQUEST_TIMEOUT,
                     ) as resp:
                         if resp.status == 401:
                             raise JudoAuthError("Ungültige Zugangsdaten")
@@ -162,11 +195,23 @@ class JudoApiClient:
                             raise JudoApiError(
                                 f"HTTP {resp.status} für {url}: {text}"
                             )
-                        payload: dict[str, Any] = await resp.json(
-                            content_type=None
+                        try:
+                            payload: Any = await resp.json(content_type=None)
+                        except ValueError as exc:
+                            raise JudoApiError(
+                                f"Ungültige Antwort für {url}: {exc}"
+                            ) from exc
+                        data = (
+                            payload.get("data", "")
+                            if isinstance(payload, dict)
+                            else None
                         )
-                        return payload.get("data", "")
-                except aiohttp.ClientError as exc:
+                        if not isinstance(data, str):
+                            raise JudoApiError(
+                                f"Ungültige Antwort für {url}: {payload!r}"
+                            )
+                        return data
+                except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
                     raise JudoApiError(f"Verbindungsfehler: {exc}") from exc
 
             raise JudoApiError(f"Maximale Retries erreicht für {url}")
@@ -175,25 +220,24 @@ class JudoApiClient:
 
     async def get_device_type(self) -> int:
         raw = await self._request("FF00")
-        return int(raw, 16)
+        return hex_to_int(raw)
 
     async def get_serial_number(self) -> int:
         raw = await self._request("0600")
-        b = hex_to_bytes(raw)
+        b = hex_to_bytes(raw, 4)
         return from_u32_le(b)
 
     async def get_fw_version(self) -> str:
         raw = await self._request("0100")
-        b = hex_to_bytes(raw)
+        b = hex_to_bytes(raw, 3)
         return f"{b[2]}.{b[1]}{chr(b[0])}"
 
     async def get_commission_date(self) -> datetime | None:
         raw = await self._request("0E00")
         try:
-            b = hex_to_bytes(raw)
-            ts = from_u32_be(b)
-            return datetime.utcfromtimestamp(ts)
-        except Exception:
+            ts = from_u32_be(hex_to_bytes(raw, 4))
+            return datetime.fromtimestamp(ts, _UTC)
+        except (JudoApiError, ValueError, OverflowError, OSError):
             return None
 
     async def get_device_info(self) -> DeviceInfo:
@@ -215,29 +259,29 @@ class JudoApiClient:
     async def get_total_water(self) -> int:
         """Gesamtwasser in Litern."""
         raw = await self._request("2800")
-        b = hex_to_bytes(raw)
+        b = hex_to_bytes(raw, 4)
         return from_u32_le(b)
 
     async def get_sleep_hours(self) -> int:
         raw = await self._request("6600")
-        return int(raw, 16)
+        return hex_to_int(raw)
 
     async def get_learn_status(self) -> tuple[bool, int]:
         """Gibt (aktiv, rest_liter) zurück."""
         raw = await self._request("6400")
-        b = hex_to_bytes(raw)
+        b = hex_to_bytes(raw, 3)
         active = bool(b[0])
         remaining = from_u16_le(b, 1)
         return active, remaining
 
     async def get_microleak_mode(self) -> int:
         raw = await self._request("6500")
-        return int(raw, 16)
+        return hex_to_int(raw)
 
     async def get_absence_limits(self) -> tuple[int, int, int]:
         """Gibt (flow_l_h, volume_l, duration_min) zurück."""
         raw = await self._request("5E00")
-        b = hex_to_bytes(raw)
+        b = hex_to_bytes(raw, 6)
         flow = from_u16_le(b, 0)
         volume = from_u16_le(b, 2)
         duration = from_u16_le(b, 4)
@@ -246,32 +290,70 @@ class JudoApiClient:
     async def get_device_datetime(self) -> datetime | None:
         raw = await self._request("5900")
         try:
-            b = hex_to_bytes(raw)
+            b = hex_to_bytes(raw, 6)
             day, month, year, hour, minute, second = b[0], b[1], b[2], b[3], b[4], b[5]
             return datetime(2000 + year, month, day, hour, minute, second)
-        except Exception:
+        except (JudoApiError, ValueError):
             return None
 
-    async def get_status(self) -> DeviceStatus:
-        """Liest alle Statuswerte in parallelen Requests."""
-        (
-            total_water,
-            sleep_hours,
-            learn_status,
-            microleak_mode,
-            absence_limits,
-            device_datetime,
-        ) = await asyncio.gather(
+    async def get_status(
+        self, previous: DeviceStatus | None = None
+    ) -> tuple[DeviceStatus, tuple[JudoApiError | None, ...]]:
+        """Liest alle Statuswerte in parallelen Requests.
+
+        Gibt den Status und je Teilabfrage (Reihenfolge wie ``STATUS_LEGS``)
+        den aufgetretenen Fehler oder None zurück. Fehlgeschlagene Werte
+        werden aus ``previous`` übernommen; ohne vorherigen Status wird der
+        erste Fehler weitergereicht. Wie lange veraltete Werte akzeptabel
+        sind, entscheidet der Aufrufer.
+        """
+        results = await asyncio.gather(
             self.get_total_water(),
             self.get_sleep_hours(),
             self.get_learn_status(),
             self.get_microleak_mode(),
             self.get_absence_limits(),
             self.get_device_datetime(),
+            return_exceptions=True,
         )
+        errors = tuple(
+            r if isinstance(r, BaseException) else None for r in results
+        )
+        failed = [err for err in errors if err is not None]
+        for err in failed:
+            if not isinstance(err, JudoApiError):
+                raise err
+        if failed and previous is None:
+            raise failed[0]
+        if failed:
+            fallback = (
+                previous.total_water_liters,
+                previous.sleep_hours,
+                (previous.learn_active, previous.learning_remaining_water),
+                previous.microleak_mode,
+                (
+                    previous.absence_flow_limit,
+                    previous.absence_volume_limit,
+                    previous.absence_duration_limit,
+                ),
+                previous.device_datetime,
+            )
+            results = [
+                fb if isinstance(r, BaseException) else r
+                for r, fb in zip(results, fallback)
+            ]
+
+        (
+            total_water,
+            sleep_hours,
+            learn_status,
+            microleak_mode,
+            absence_limits,
+            device_datetime,
+        ) = results
         learn_active, learn_remaining = learn_status
         flow, volume, duration = absence_limits
-        return DeviceStatus(
+        status = DeviceStatus(
             total_water_liters=total_water,
             sleep_hours=sleep_hours,
             learn_active=learn_active,
@@ -282,6 +364,7 @@ class JudoApiClient:
             absence_duration_limit=duration,
             device_datetime=device_datetime,
         )
+        return status, errors
 
     # ── Aktoren ───────────────────────────────────────────────────────────────
 
@@ -358,7 +441,7 @@ class JudoApiClient:
     async def read_absence_schedule(self, index: int) -> AbsenceWindow:
         """Liest einen Abwesenheitszeitraum (Index 0–6)."""
         raw = await self._request(f"60{to_u8_hex(index):0>2}00")
-        b = hex_to_bytes(raw)
+        b = hex_to_bytes(raw, 6)
         return AbsenceWindow(
             index=index,
             start_day=b[0],
@@ -394,7 +477,7 @@ class JudoApiClient:
         yr_lo = year & 0xFF
         cmd = f"FB00{to_u8_hex(day)}{to_u8_hex(month)}{yr_lo:02X}{yr_hi:02X}"
         raw = await self._request(cmd)
-        b = hex_to_bytes(raw)
+        b = hex_to_bytes(raw, 8 * 4)
         return [from_u32_le(b, i * 4) for i in range(8)]
 
     async def get_weekly_usage(self, week: int, year: int) -> list[int]:
@@ -403,7 +486,7 @@ class JudoApiClient:
         yr_lo = year & 0xFF
         cmd = f"FC00{to_u8_hex(week)}{yr_lo:02X}{yr_hi:02X}"
         raw = await self._request(cmd)
-        b = hex_to_bytes(raw)
+        b = hex_to_bytes(raw, 7 * 4)
         return [from_u32_le(b, i * 4) for i in range(7)]
 
     async def get_monthly_usage(self, month: int, year: int) -> list[int]:
@@ -422,5 +505,5 @@ class JudoApiClient:
         yr_lo = year & 0xFF
         cmd = f"FE00{yr_lo:02X}{yr_hi:02X}"
         raw = await self._request(cmd)
-        b = hex_to_bytes(raw)
+        b = hex_to_bytes(raw, 12 * 4)
         return [from_u32_le(b, i * 4) for i in range(12)]
@@ -7,7 +7,6 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -39,15 +38,11 @@ class JudoLearnActiveSensor(
     ) -> None:
         super().__init__(coordinator)
         self._attr_unique_id = f"{entry.entry_id}_learn_active"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="JUDO ZEWA i-SAFE",
-            manufacturer="JUDO Wasseraufbereitung GmbH",
-            model="ZEWA i-SAFE",
-        )
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool | None:
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return None
-        return self.coordinator.data.status.learn_active
+        return data.status.learn_active
@@ -8,10 +8,9 @@ from homeassistant.components.button import ButtonEntity, ButtonEntityDescriptio
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .api import JudoApiClient
+from .api import JudoApiClient, JudoApiError
 from .const import DOMAIN
 from .coordinator import JudoDataUpdateCoordinator
 
@@ -26,19 +25,19 @@ BUTTON_DESCRIPTIONS: tuple[JudoButtonEntityDescription, ...] = (
         key="reset_alarms",
         name="Meldungen zurücksetzen",
         icon="mdi:bell-off",
-        press_fn=lambda c: c.ack_alarm(),
+        press_fn=JudoApiClient.ack_alarm,
     ),
     JudoButtonEntityDescription(
         key="start_microleak_test",
         name="Mikroleck-Test starten",
         icon="mdi:water-check",
-        press_fn=lambda c: c.start_microleak_test(),
+        press_fn=JudoApiClient.start_microleak_test,
     ),
     JudoButtonEntityDescription(
         key="start_learning",
         name="Lernmodus starten",
         icon="mdi:school",
-        press_fn=lambda c: c.start_learning(),
+        press_fn=JudoApiClient.start_learning,
     ),
 )
 
@@ -49,9 +48,9 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     coordinator: JudoDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    client = coordinator.client
     async_add_entities(
-        JudoButton(description, client, entry) for description in BUTTON_DESCRIPTIONS
+        JudoButton(coordinator, description, entry)
+        for description in BUTTON_DESCRIPTIONS
     )
 
 
@@ -60,27 +59,26 @@ class JudoButton(ButtonEntity):
 
     entity_description: JudoButtonEntityDescription
     _attr_has_entity_name = True
+    _attr_should_poll = False
 
     def __init__(
         self,
+        coordinator: JudoDataUpdateCoordinator,
         description: JudoButtonEntityDescription,
-        client: JudoApiClient,
         entry: ConfigEntry,
     ) -> None:
         self.entity_description = description
-        self._client = client
+        self._coordinator = coordinator
+        self._client = coordinator.client
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="JUDO ZEWA i-SAFE",
-            manufacturer="JUDO Wasseraufbereitung GmbH",
-            model="ZEWA i-SAFE",
-        )
+        self._attr_device_info = coordinator.device_info
 
     async def async_press(self) -> None:
         try:
             await self.entity_description.press_fn(self._client)
-        except Exception as exc:
+        except JudoApiError as exc:
             raise HomeAssistantError(
                 f"Aktion '{self.entity_description.key}' fehlgeschlagen: {exc}"
             ) from exc
+        # Lernmodus/Meldungen ändern den Gerätestatus → zeitnah neu lesen
+        self._coordinator.async_request_refresh_background()
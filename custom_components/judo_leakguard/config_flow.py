@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import re
 from typing import Any
 
 import aiohttp
@@ -32,6 +33,19 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+# Host mit optionalem "http://" und abschließendem "/" (z. B. "http://192.168.1.5/").
+# "https://" wird abgewiesen: Das Gerät spricht nur HTTP, ein stilles
+# Herabstufen würde die Zugangsdaten unverschlüsselt senden.
+_HOST_RE = re.compile(r"^(?:http://)?([^/\s]+)/?$", re.IGNORECASE)
+
+
+def _normalize_host(raw: str) -> str | None:
+    """Gibt den reinen Host zurück oder None, wenn die Eingabe ungültig ist."""
+    match = _HOST_RE.match(raw.strip())
+    if match is None:
+        return None
+    return match.group(1)
+
 
 async def _validate_connection(
     hass: HomeAssistant, data: dict[str, Any]
@@ -65,22 +79,28 @@ class JudoLeakguardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            try:
-                info = await _validate_connection(self.hass, user_input)
-            except JudoAuthError:
-                errors["base"] = "invalid_auth"
-            except JudoApiError:
-                errors["base"] = "cannot_connect"
-            except ValueError as exc:
-                _LOGGER.warning("Gerätetyp-Fehler: %s", exc)
-                errors["base"] = "wrong_device_type"
-            except Exception:  # noqa: BLE001
-                _LOGGER.exception("Unerwarteter Fehler beim Verbindungstest")
-                errors["base"] = "unknown"
+            host = _normalize_host(user_input[CONF_HOST])
+            if host is None:
+                # Ungültige Eingabe ohne Netzwerk-Roundtrip abweisen
+                errors["base"] = "invalid_host"
             else:
-                return self.async_create_entry(
-                    title=info["title"], data=user_input
-                )
+                user_input = {**user_input, CONF_HOST: host}
+                try:
+                    info = await _validate_connection(self.hass, user_input)
+                except JudoAuthError:
+                    errors["base"] = "invalid_auth"
+                except JudoApiError:
+                    errors["base"] = "cannot_connect"
+                except ValueError as exc:
+                    _LOGGER.warning("Gerätetyp-Fehler: %s", exc)
+                    errors["base"] = "wrong_device_type"
+                except Exception:  # noqa: BLE001
+                    _LOGGER.exception("Unerwarteter Fehler beim Verbindungstest")
+                    errors["base"] = "unknown"
+                else:
+                    return self.async_create_entry(
+                        title=info["title"], data=user_input
+                    )
 
         return self.async_show_form(
             step_id="user",
@@ -1,4 +1,5 @@
 """Konstanten für die JUDO ZEWA i-SAFE Integration."""
+from homeassistant.const import Platform
 
 DOMAIN = "judo_leakguard"
 
@@ -103,28 +104,21 @@ CMD_STAT_YEAR = "FE"              # + 2 B (Jahr 2B) → 48 B
 WEEKDAYS = ["So", "Mo", "Di", "Mi", "Do", "Fr", "Sa"]
 
 # ── Urlaubstypen ──────────────────────────────────────────────────────────────
-VACATION_TYPES = {
-    0: "off",
-    1: "u1",
-    2: "u2",
-    3: "u3",
-}
-VACATION_TYPES_REVERSE = {v: k for k, v in VACATION_TYPES.items()}
+# Index = Gerätewert
+VACATION_TYPES: tuple[str, ...] = ("off", "u1", "u2", "u3")
+VACATION_TYPES_REVERSE = {v: k for k, v in enumerate(VACATION_TYPES)}
 
 # ── Mikroleck-Modi ────────────────────────────────────────────────────────────
-MICROLEAK_MODES = {
-    0: "off",
-    1: "notify",
-    2: "notify_and_close",
-}
-MICROLEAK_MODES_REVERSE = {v: k for k, v in MICROLEAK_MODES.items()}
+# Index = Gerätewert
+MICROLEAK_MODES: tuple[str, ...] = ("off", "notify", "notify_and_close")
+MICROLEAK_MODES_REVERSE = {v: k for k, v in enumerate(MICROLEAK_MODES)}
 
 # ── Plattformen ───────────────────────────────────────────────────────────────
-PLATFORMS = [
-    "sensor",
-    "binary_sensor",
-    "switch",
-    "button",
-    "number",
-    "select",
-]
+PLATFORMS: tuple[Platform, ...] = (
+    Platform.SENSOR,
+    Platform.BINARY_SENSOR,
+    Platform.SWITCH,
+    Platform.BUTTON,
+    Platform.NUMBER,
+    Platform.SELECT,
+)
@@ -5,16 +5,28 @@ import logging
 from dataclasses import dataclass
 from datetime import timedelta
 
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .api import DeviceInfo, DeviceStatus, JudoApiClient, JudoApiError
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
+from .api import (
+    STATUS_LEGS,
+    DeviceInfo,
+    DeviceStatus,
+    JudoApiClient,
+    JudoApiError,
+)
+from .const import DEFAULT_SCAN_INTERVAL, DEVICE_TYPE_NAMES, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Wie viele Polls in Folge ein einzelner Statuswert aus dem letzten
+# Status übernommen wird, bevor der Abruf als fehlgeschlagen gilt
+_MAX_STALE_POLLS = 3
 
-@dataclass
+
+@dataclass(slots=True)
 class JudoData:
     info: DeviceInfo
     status: DeviceStatus
@@ -23,28 +35,121 @@ class JudoData:
 class JudoDataUpdateCoordinator(DataUpdateCoordinator[JudoData]):
     """Koordiniert den periodischen Datenabruf vom Gerät."""
 
-    def __init__(self, hass: HomeAssistant, client: JudoApiClient) -> None:
+    def __init__(
+        self, hass: HomeAssistant, client: JudoApiClient, entry: ConfigEntry
+    ) -> None:
         super().__init__(
             hass,
             _LOGGER,
+            config_entry=entry,
             name=DOMAIN,
             update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
         )
         self.client = client
+        # Gerätetyp, Seriennummer, Firmware und Inbetriebnahme ändern sich
+        # nicht – sie werden beim ersten Abruf gelesen statt bei jedem Poll.
+        # Nach einem fehlgeschlagenen Poll (z. B. Neustart durch
+        # Firmware-Update) erneut lesen – nicht aber, wenn nur ein einzelner
+        # Statuswert zu lange veraltet war: Das Gerät war dann erreichbar.
+        self._info: DeviceInfo | None = None
+        self._stale_failure = False
+        # Aufeinanderfolgende Fehlschläge je Teilabfrage von get_status
+        self._status_failures = [0] * len(STATUS_LEGS)
+        self._status_warned: set[int] = set()
+        # Von allen Entitäten geteilt; wird nach dem ersten Abruf ergänzt.
+        self.device_info = dr.DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name="JUDO ZEWA i-SAFE",
+            manufacturer="JUDO Wasseraufbereitung GmbH",
+            model="ZEWA i-SAFE",
+        )
+
+    @callback
+    def async_request_refresh_background(self) -> None:
+        """Fordert einen Refresh an, ohne auf den Abruf zu warten.
+
+        Der Debouncer von async_request_refresh fasst schnell aufeinander
+        folgende Anforderungen (z. B. mehrere Schreibzugriffe) zusammen.
+        """
+        self.hass.async_create_background_task(
+            self.async_request_refresh(), f"{DOMAIN}_request_refresh"
+        )
 
     async def _async_update_data(self) -> JudoData:
+        reread_info = self._info is None or (
+            not self.last_update_success and not self._stale_failure
+        )
+        self._stale_failure = False
         try:
-            info, status = await _gather_data(self.client)
+            if reread_info:
+                info = await self.client.get_device_info()
+                if info != self._info:
+                    self._info = info
+                    self._update_device_info(info)
+            previous = self.data.status if self.data is not None else None
+            status, errors = await self.client.get_status(previous)
         except JudoApiError as exc:
             raise UpdateFailed(f"Fehler beim Datenabruf: {exc}") from exc
-        return JudoData(info=info, status=status)
+        self._track_status_errors(errors)
+        return JudoData(info=self._info, status=status)
+
+    def _track_status_errors(
+        self, errors: tuple[JudoApiError | None, ...]
+    ) -> None:
+        """Zählt Fehlerserien je Statuswert und begrenzt veraltete Werte.
 
+        Die Zähler werden immer zuerst fortgeschrieben, auch wenn der Abruf
+        anschließend als fehlgeschlagen gilt.
+        """
+        failures = self._status_failures
+        warned = self._status_warned
+        all_failed = all(err is not None for err in errors)
+        for i, err in enumerate(errors):
+            if err is None:
+                failures[i] = 0
+                if i in warned:
+                    warned.discard(i)
+                    _LOGGER.info("%s wieder lesbar", STATUS_LEGS[i])
+                continue
+            failures[i] += 1
+            # Einmal je Fehlerserie warnen, sobald ein veralteter Wert
+            # tatsächlich weiterverwendet wird (Totalausfall meldet HA selbst)
+            if not all_failed and i not in warned:
+                warned.add(i)
+                _LOGGER.warning(
+                    "%s nicht lesbar, letzter Wert wird höchstens %d Abrufe "
+                    "beibehalten: %s",
+                    STATUS_LEGS[i],
+                    _MAX_STALE_POLLS,
+                    err,
+                )
+        if all_failed:
+            raise UpdateFailed(
+                f"Fehler beim Datenabruf: {errors[0]}"
+            ) from errors[0]
+        for i, err in enumerate(errors):
+            if failures[i] > _MAX_STALE_POLLS:
+                self._stale_failure = True
+                raise UpdateFailed(
+                    f"{STATUS_LEGS[i]} {failures[i]}× in Folge nicht lesbar: {err}"
+                ) from err
 
-async def _gather_data(client: JudoApiClient) -> tuple[DeviceInfo, DeviceStatus]:
-    """Holt Geräteinfos und Betriebsstatus parallel."""
-    import asyncio
+    def _update_device_info(self, info: DeviceInfo) -> None:
+        """Ergänzt die DeviceInfo um die vom Gerät gelesenen Stammdaten."""
+        self.device_info["model"] = DEVICE_TYPE_NAMES.get(
+            info.device_type, "ZEWA i-SAFE"
+        )
+        self.device_info["serial_number"] = str(info.serial_number)
+        self.device_info["sw_version"] = info.fw_version
 
-    return await asyncio.gather(
-        client.get_device_info(),
-        client.get_status(),
-    )
+        registry = dr.async_get(self.hass)
+        device = registry.async_get_device(
+            identifiers=self.device_info["identifiers"]
+        )
+        if device is not None:
+            registry.async_update_device(
+                device.id,
+                model=self.device_info["model"],
+                serial_number=self.device_info["serial_number"],
+                sw_version=self.device_info["sw_version"],
+            )
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Callable, Awaitable, Any
 
 from homeassistant.components.number import (
@@ -14,11 +15,10 @@ from homeassistant.components.number import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .api import JudoApiClient
+from .api import JudoApiClient, JudoApiError
 from .const import DOMAIN
 from .coordinator import JudoData, JudoDataUpdateCoordinator
 
@@ -28,7 +28,25 @@ _LOGGER = logging.getLogger(__name__)
 @dataclass(frozen=True, kw_only=True)
 class JudoNumberEntityDescription(NumberEntityDescription):
     value_fn: Callable[[JudoData], float | int | None] = lambda _: None
-    set_fn: Callable[[JudoApiClient, float], Awaitable[None]] | None = None
+    set_fn: Callable[[JudoApiClient, int], Awaitable[None]] | None = None
+
+
+# Helfer: einzelne Absence-Werte setzen. Die beiden anderen Limits werden
+# unmittelbar vorher vom Gerät gelesen, damit Änderungen am Gerät oder in der
+# Hersteller-App nicht mit veralteten Coordinator-Daten überschrieben werden.
+async def _set_absence_flow(client: JudoApiClient, value: int) -> None:
+    flow, volume, duration = await client.get_absence_limits()
+    await client.set_absence_limits(value, volume, duration)
+
+
+async def _set_absence_volume(client: JudoApiClient, value: int) -> None:
+    flow, volume, duration = await client.get_absence_limits()
+    await client.set_absence_limits(flow, value, duration)
+
+
+async def _set_absence_duration(client: JudoApiClient, value: int) -> None:
+    flow, volume, duration = await client.get_absence_limits()
+    await client.set_absence_limits(flow, volume, value)
 
 
 NUMBER_DESCRIPTIONS: tuple[JudoNumberEntityDescription, ...] = (
@@ -42,8 +60,8 @@ NUMBER_DESCRIPTIONS: tuple[JudoNumberEntityDescription, ...] = (
         native_step=1,
         native_unit_of_measurement="h",
         mode=NumberMode.BOX,
-        value_fn=lambda d: d.status.sleep_hours,
-        set_fn=lambda c, v: c.set_sleep_hours(int(v)),
+        value_fn=attrgetter("status.sleep_hours"),
+        set_fn=JudoApiClient.set_sleep_hours,
     ),
     # ── Abwesenheit: Durchfluss-Limit ─────────────────────────────────────────
     JudoNumberEntityDescription(
@@ -55,8 +73,8 @@ NUMBER_DESCRIPTIONS: tuple[JudoNumberEntityDescription, ...] = (
         native_step=1,
         native_unit_of_measurement="L/h",
         mode=NumberMode.BOX,
-        value_fn=lambda d: d.status.absence_flow_limit,
-        set_fn=lambda c, v: _set_absence_flow(c, int(v)),
+        value_fn=attrgetter("status.absence_flow_limit"),
+        set_fn=_set_absence_flow,
     ),
     # ── Abwesenheit: Volumen-Limit ────────────────────────────────────────────
     JudoNumberEntityDescription(
@@ -68,8 +86,8 @@ NUMBER_DESCRIPTIONS: tuple[JudoNumberEntityDescription, ...] = (
         native_step=1,
         native_unit_of_measurement="L",
         mode=NumberMode.BOX,
-        value_fn=lambda d: d.status.absence_volume_limit,
-        set_fn=lambda c, v: _set_absence_volume(c, int(v)),
+        value_fn=attrgetter("status.absence_volume_limit"),
+        set_fn=_set_absence_volume,
     ),
     # ── Abwesenheit: Dauer-Limit ──────────────────────────────────────────────
     JudoNumberEntityDescription(
@@ -81,29 +99,12 @@ NUMBER_DESCRIPTIONS: tuple[JudoNumberEntityDescription, ...] = (
         native_step=1,
         native_unit_of_measurement="min",
         mode=NumberMode.BOX,
-        value_fn=lambda d: d.status.absence_duration_limit,
-        set_fn=lambda c, v: _set_absence_duration(c, int(v)),
+        value_fn=attrgetter("status.absence_duration_limit"),
+        set_fn=_set_absence_duration,
     ),
 )
 
 
-# Helfer: einzelne Absence-Werte setzen, andere aus Coordinator-Daten lesen
-async def _set_absence_flow(client: JudoApiClient, value: int) -> None:
-    # Wir rufen die aktuellen Limits ab und überschreiben nur den Flow-Wert
-    flow, volume, duration = await client.get_absence_limits()
-    await client.set_absence_limits(value, volume, duration)
-
-
-async def _set_absence_volume(client: JudoApiClient, value: int) -> None:
-    flow, volume, duration = await client.get_absence_limits()
-    await client.set_absence_limits(flow, value, duration)
-
-
-async def _set_absence_duration(client: JudoApiClient, value: int) -> None:
-    flow, volume, duration = await client.get_absence_limits()
-    await client.set_absence_limits(flow, volume, value)
-
-
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -131,24 +132,21 @@ class JudoNumber(CoordinatorEntity[JudoDataUpdateCoordinator], NumberEntity):
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="JUDO ZEWA i-SAFE",
-            manufacturer="JUDO Wasseraufbereitung GmbH",
-            model="ZEWA i-SAFE",
-        )
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> float | int | None:
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return None
-        return self.entity_description.value_fn(self.coordinator.data)
+        return self.entity_description.value_fn(data)
 
     async def async_set_native_value(self, value: float) -> None:
+        key = self.entity_description.key
         try:
-            await self.entity_description.set_fn(self.coordinator.client, value)
-            await self.coordinator.async_request_refresh()
-        except Exception as exc:
+            await self.entity_description.set_fn(self.coordinator.client, int(value))
+        except JudoApiError as exc:
             raise HomeAssistantError(
-                f"Setzen von '{self.entity_description.key}' fehlgeschlagen: {exc}"
+                f"Setzen von '{key}' fehlgeschlagen: {exc}"
             ) from exc
+        self.coordinator.async_request_refresh_background()
@@ -3,17 +3,17 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Callable, Awaitable
+from operator import attrgetter
+from typing import Awaitable, Callable, Mapping
 
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .api import JudoApiClient
+from .api import JudoApiClient, JudoApiError
 from .const import (
     DOMAIN,
     MICROLEAK_MODES,
@@ -28,9 +28,10 @@ _LOGGER = logging.getLogger(__name__)
 
 @dataclass(frozen=True, kw_only=True)
 class JudoSelectEntityDescription(SelectEntityDescription):
-    options_list: list[str] = None  # type: ignore[assignment]
-    current_option_fn: Callable[[JudoData], str | None] = lambda _: None
-    select_fn: Callable[[JudoApiClient, str], Awaitable[None]] | None = None
+    from_int: tuple[str, ...]    # Gerätewert → Option
+    to_int: Mapping[str, int]    # Option → Gerätewert
+    value_fn: Callable[[JudoData], int | None] = lambda _: None
+    set_fn: Callable[[JudoApiClient, int], Awaitable[None]]
 
 
 SELECT_DESCRIPTIONS: tuple[JudoSelectEntityDescription, ...] = (
@@ -38,17 +39,21 @@ SELECT_DESCRIPTIONS: tuple[JudoSelectEntityDescription, ...] = (
         key="vacation_type",
         name="Urlaubstyp",
         icon="mdi:beach",
-        options_list=list(VACATION_TYPES.values()),
-        current_option_fn=lambda d: None,  # kein direkter Status-Read
-        select_fn=lambda c, v: c.set_vacation_type(VACATION_TYPES_REVERSE[v]),
+        options=list(VACATION_TYPES),
+        from_int=VACATION_TYPES,
+        to_int=VACATION_TYPES_REVERSE,
+        # kein direkter Status-Read → value_fn bleibt beim Default (None)
+        set_fn=JudoApiClient.set_vacation_type,
     ),
     JudoSelectEntityDescription(
         key="microleak_mode",
         name="Mikroleck-Modus",
         icon="mdi:water-check",
-        options_list=list(MICROLEAK_MODES.values()),
-        current_option_fn=lambda d: MICROLEAK_MODES.get(d.status.microleak_mode),
-        select_fn=lambda c, v: c.set_microleak_mode(MICROLEAK_MODES_REVERSE[v]),
+        options=list(MICROLEAK_MODES),
+        from_int=MICROLEAK_MODES,
+        to_int=MICROLEAK_MODES_REVERSE,
+        value_fn=attrgetter("status.microleak_mode"),
+        set_fn=JudoApiClient.set_microleak_mode,
     ),
 )
 
@@ -80,25 +85,26 @@ class JudoSelect(CoordinatorEntity[JudoDataUpdateCoordinator], SelectEntity):
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_options = description.options_list
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="JUDO ZEWA i-SAFE",
-            manufacturer="JUDO Wasseraufbereitung GmbH",
-            model="ZEWA i-SAFE",
-        )
+        self._attr_device_info = coordinator.device_info
 
     @property
     def current_option(self) -> str | None:
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return None
-        return self.entity_description.current_option_fn(self.coordinator.data)
+        desc = self.entity_description
+        value = desc.value_fn(data)
+        from_int = desc.from_int
+        if value is None or not 0 <= value < len(from_int):
+            return None
+        return from_int[value]
 
     async def async_select_option(self, option: str) -> None:
+        desc = self.entity_description
         try:
-            await self.entity_description.select_fn(self.coordinator.client, option)
-            await self.coordinator.async_request_refresh()
-        except Exception as exc:
+            await desc.set_fn(self.coordinator.client, desc.to_int[option])
+        except JudoApiError as exc:
             raise HomeAssistantError(
-                f"Auswahl '{self.entity_description.key}' fehlgeschlagen: {exc}"
+                f"Auswahl '{desc.key}' fehlgeschlagen: {exc}"
             ) from exc
+        self.coordinator.async_request_refresh_background()
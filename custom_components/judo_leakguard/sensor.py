@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -13,12 +14,12 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfVolume
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
-from .const import DEVICE_TYPE_NAMES, DOMAIN, MICROLEAK_MODES
+from .const import DEVICE_TYPE_NAMES, DOMAIN
 from .coordinator import JudoData, JudoDataUpdateCoordinator
 
 
@@ -27,6 +28,14 @@ class JudoSensorEntityDescription(SensorEntityDescription):
     value_fn: Any = None  # callable(JudoData) → value
 
 
+def _device_datetime(data: JudoData) -> datetime | None:
+    """Gerätezeit als lokale Zeit der HA-Instanz (TIMESTAMP braucht eine Zeitzone)."""
+    value = data.status.device_datetime
+    if value is None:
+        return None
+    return value.replace(tzinfo=dt_util.get_default_time_zone())
+
+
 SENSOR_DESCRIPTIONS: tuple[JudoSensorEntityDescription, ...] = (
     # ── Geräteinfos ──────────────────────────────────────────────────────────
     JudoSensorEntityDescription(
@@ -45,14 +54,14 @@ SENSOR_DESCRIPTIONS: tuple[JudoSensorEntityDescription, ...] = (
         key="device_firmware",
         name="Firmware-Version",
         icon="mdi:chip",
-        value_fn=lambda d: d.info.fw_version,
+        value_fn=attrgetter("info.fw_version"),
     ),
     JudoSensorEntityDescription(
         key="installation_date",
         name="Inbetriebnahmedatum",
         icon="mdi:calendar",
         device_class=SensorDeviceClass.TIMESTAMP,
-        value_fn=lambda d: d.info.commission_date,
+        value_fn=attrgetter("info.commission_date"),
     ),
     # ── Betriebsdaten ─────────────────────────────────────────────────────────
     JudoSensorEntityDescription(
@@ -62,7 +71,7 @@ SENSOR_DESCRIPTIONS: tuple[JudoSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfVolume.LITERS,
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        value_fn=lambda d: d.status.total_water_liters,
+        value_fn=attrgetter("status.total_water_liters"),
     ),
     JudoSensorEntityDescription(
         key="total_water_m3",
@@ -79,14 +88,14 @@ SENSOR_DESCRIPTIONS: tuple[JudoSensorEntityDescription, ...] = (
         name="Schlafdauer",
         icon="mdi:sleep",
         native_unit_of_measurement="h",
-        value_fn=lambda d: d.status.sleep_hours,
+        value_fn=attrgetter("status.sleep_hours"),
     ),
     JudoSensorEntityDescription(
         key="learning_remaining_water",
         name="Lernmodus Restwasser",
         icon="mdi:water-sync",
         native_unit_of_measurement=UnitOfVolume.LITERS,
-        value_fn=lambda d: d.status.learning_remaining_water,
+        value_fn=attrgetter("status.learning_remaining_water"),
     ),
     # ── Abwesenheitslimits ────────────────────────────────────────────────────
     JudoSensorEntityDescription(
@@ -94,21 +103,21 @@ SENSOR_DESCRIPTIONS: tuple[JudoSensorEntityDescription, ...] = (
         name="Abwesenheit – Durchfluss-Limit",
         icon="mdi:water-pump",
         native_unit_of_measurement="L/h",
-        value_fn=lambda d: d.status.absence_flow_limit,
+        value_fn=attrgetter("status.absence_flow_limit"),
     ),
     JudoSensorEntityDescription(
         key="absence_volume_limit",
         name="Abwesenheit – Volumen-Limit",
         icon="mdi:water-boiler",
         native_unit_of_measurement=UnitOfVolume.LITERS,
-        value_fn=lambda d: d.status.absence_volume_limit,
+        value_fn=attrgetter("status.absence_volume_limit"),
     ),
     JudoSensorEntityDescription(
         key="absence_duration_limit",
         name="Abwesenheit – Dauer-Limit",
         icon="mdi:timer",
         native_unit_of_measurement="min",
-        value_fn=lambda d: d.status.absence_duration_limit,
+        value_fn=attrgetter("status.absence_duration_limit"),
     ),
     # ── Datum/Zeit ────────────────────────────────────────────────────────────
     JudoSensorEntityDescription(
@@ -116,7 +125,7 @@ SENSOR_DESCRIPTIONS: tuple[JudoSensorEntityDescription, ...] = (
         name="Gerätedatum/-zeit",
         icon="mdi:clock-outline",
         device_class=SensorDeviceClass.TIMESTAMP,
-        value_fn=lambda d: d.status.device_datetime,
+        value_fn=_device_datetime,
     ),
 )
 
@@ -148,15 +157,23 @@ class JudoSensor(CoordinatorEntity[JudoDataUpdateCoordinator], SensorEntity):
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="JUDO ZEWA i-SAFE",
-            manufacturer="JUDO Wasseraufbereitung GmbH",
-            model="ZEWA i-SAFE",
-        )
-
-    @property
-    def native_value(self) -> Any:
-        if self.coordinator.data is None:
+        self._attr_device_info = coordinator.device_info
+        self._attr_native_value = self._compute_value()
+        self._last_available = coordinator.last_update_success
+
+    def _compute_value(self) -> Any:
+        data = self.coordinator.data
+        if data is None:
             return None
-        return self.entity_description.value_fn(self.coordinator.data)
+        return self.entity_description.value_fn(data)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Wert einmal pro Refresh berechnen; nur bei Änderung schreiben."""
+        value = self._compute_value()
+        available = self.available
+        if value == self._attr_native_value and available == self._last_available:
+            return
+        self._attr_native_value = value
+        self._last_available = available
+        self.async_write_ha_state()
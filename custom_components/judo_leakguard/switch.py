@@ -7,159 +7,130 @@ der angezeigte Zustand entspricht dem zuletzt gesendeten Befehl.
 from __future__ import annotations
 
 import logging
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
 
-from homeassistant.components.switch import SwitchEntity
+from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 
-from .api import JudoApiClient
+from .api import JudoApiClient, JudoApiError
 from .const import DOMAIN
 from .coordinator import JudoDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, kw_only=True)
+class JudoSwitchEntityDescription(SwitchEntityDescription):
+    turn_on_fn: Callable[[JudoApiClient], Awaitable[None]]
+    turn_off_fn: Callable[[JudoApiClient], Awaitable[None]]
+    # Aktionsbezeichnungen für Fehlermeldungen, z. B. "Ventil öffnen"
+    turn_on_label: str
+    turn_off_label: str
+    default_on: bool | None = False  # Zustand ohne wiederherstellbaren State
+
+
+SWITCH_DESCRIPTIONS: tuple[JudoSwitchEntityDescription, ...] = (
+    # ── Ventil (ON = offen, OFF = geschlossen) ───────────────────────────────
+    JudoSwitchEntityDescription(
+        key="valve_open",
+        name="Ventil",
+        icon="mdi:valve",
+        turn_on_fn=JudoApiClient.valve_open,
+        turn_off_fn=JudoApiClient.valve_close,
+        turn_on_label="Ventil öffnen",
+        turn_off_label="Ventil schließen",
+        default_on=None,  # unbekannt – kein Readback der Ventilstellung
+    ),
+    # ── Sleep-Modus ───────────────────────────────────────────────────────────
+    JudoSwitchEntityDescription(
+        key="sleep_mode",
+        name="Sleep-Modus",
+        icon="mdi:sleep",
+        turn_on_fn=JudoApiClient.sleep_start,
+        turn_off_fn=JudoApiClient.sleep_stop,
+        turn_on_label="Sleep-Modus starten",
+        turn_off_label="Sleep-Modus beenden",
+    ),
+    # ── Urlaubsmodus ──────────────────────────────────────────────────────────
+    JudoSwitchEntityDescription(
+        key="vacation_mode",
+        name="Urlaubsmodus",
+        icon="mdi:beach",
+        turn_on_fn=JudoApiClient.vacation_start,
+        turn_off_fn=JudoApiClient.vacation_stop,
+        turn_on_label="Urlaubsmodus starten",
+        turn_off_label="Urlaubsmodus beenden",
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     coordinator: JudoDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    client = coordinator.client
     async_add_entities(
-        [
-            JudoValveSwitch(coordinator, client, entry),
-            JudoSleepModeSwitch(coordinator, client, entry),
-            JudoVacationModeSwitch(coordinator, client, entry),
-        ]
+        JudoOptimisticSwitch(coordinator, description, entry)
+        for description in SWITCH_DESCRIPTIONS
     )
 
 
-class JudoOptimisticSwitch(
-    RestoreEntity, SwitchEntity
-):
-    """Basisklasse für optimistische Switches (kein Status-Readback)."""
+class JudoOptimisticSwitch(RestoreEntity, SwitchEntity):
+    """Optimistischer Switch (kein Status-Readback).
 
+    Bewusst nicht an die Verfügbarkeit des Coordinators gekoppelt: Ein
+    fehlgeschlagener Poll darf z. B. das Schließen des Ventils per
+    Automation nicht blockieren.
+    """
+
+    entity_description: JudoSwitchEntityDescription
     _attr_has_entity_name = True
     _attr_assumed_state = True
+    # Kein Readback → HA muss diese Entitäten nicht zyklisch pollen
+    _attr_should_poll = False
 
     def __init__(
         self,
         coordinator: JudoDataUpdateCoordinator,
-        client: JudoApiClient,
+        description: JudoSwitchEntityDescription,
         entry: ConfigEntry,
     ) -> None:
-        self._coordinator = coordinator
-        self._client = client
-        self._is_on: bool = False
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="JUDO ZEWA i-SAFE",
-            manufacturer="JUDO Wasseraufbereitung GmbH",
-            model="ZEWA i-SAFE",
-        )
+        self.entity_description = description
+        self._client = coordinator.client
+        self._attr_is_on = description.default_on
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_device_info = coordinator.device_info
 
     async def async_added_to_hass(self) -> None:
         """Letzten Zustand aus dem HA-State-Store wiederherstellen."""
         await super().async_added_to_hass()
         last_state = await self.async_get_last_state()
-        if last_state is not None:
-            self._is_on = last_state.state == "on"
-
-    @property
-    def is_on(self) -> bool:
-        return self._is_on
-
-
-# ── Ventil ────────────────────────────────────────────────────────────────────
-
-class JudoValveSwitch(JudoOptimisticSwitch):
-    """Steuert das Absperrventil (ON = offen, OFF = geschlossen)."""
-
-    _attr_name = "Ventil"
-    _attr_icon = "mdi:valve"
-
-    def __init__(self, coordinator, client, entry):
-        super().__init__(coordinator, client, entry)
-        self._attr_unique_id = f"{entry.entry_id}_valve_open"
-        # Standardzustand: offen
-        self._is_on = True
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        try:
-            await self._client.valve_open()
-            self._is_on = True
-            self.async_write_ha_state()
-        except Exception as exc:
-            raise HomeAssistantError(f"Ventil öffnen fehlgeschlagen: {exc}") from exc
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        try:
-            await self._client.valve_close()
-            self._is_on = False
-            self.async_write_ha_state()
-        except Exception as exc:
-            raise HomeAssistantError(f"Ventil schließen fehlgeschlagen: {exc}") from exc
-
-
-# ── Sleep-Modus ───────────────────────────────────────────────────────────────
-
-class JudoSleepModeSwitch(JudoOptimisticSwitch):
-    """Steuert den Sleep-Modus."""
-
-    _attr_name = "Sleep-Modus"
-    _attr_icon = "mdi:sleep"
-
-    def __init__(self, coordinator, client, entry):
-        super().__init__(coordinator, client, entry)
-        self._attr_unique_id = f"{entry.entry_id}_sleep_mode"
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        try:
-            await self._client.sleep_start()
-            self._is_on = True
-            self.async_write_ha_state()
-        except Exception as exc:
-            raise HomeAssistantError(f"Sleep-Modus starten fehlgeschlagen: {exc}") from exc
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        try:
-            await self._client.sleep_stop()
-            self._is_on = False
-            self.async_write_ha_state()
-        except Exception as exc:
-            raise HomeAssistantError(f"Sleep-Modus beenden fehlgeschlagen: {exc}") from exc
-
-
-# ── Urlaubsmodus ──────────────────────────────────────────────────────────────
-
-class JudoVacationModeSwitch(JudoOptimisticSwitch):
-    """Steuert den Urlaubsmodus."""
-
-    _attr_name = "Urlaubsmodus"
-    _attr_icon = "mdi:beach"
-
-    def __init__(self, coordinator, client, entry):
-        super().__init__(coordinator, client, entry)
-        self._attr_unique_id = f"{entry.entry_id}_vacation_mode"
+        if last_state is not None and last_state.state in (STATE_ON, STATE_OFF):
+            self._attr_is_on = last_state.state == STATE_ON
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         try:
-            await self._client.vacation_start()
-            self._is_on = True
-            self.async_write_ha_state()
-        except Exception as exc:
-            raise HomeAssistantError(f"Urlaubsmodus starten fehlgeschlagen: {exc}") from exc
+            await self.entity_description.turn_on_fn(self._client)
+        except JudoApiError as exc:
+            raise HomeAssistantError(
+                f"{self.entity_description.turn_on_label} fehlgeschlagen: {exc}"
+            ) from exc
+        self._attr_is_on = True
+        self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         try:
-            await self._client.vacation_stop()
-            self._is_on = False
-            self.async_write_ha_state()
-        except Exception as exc:
-            raise HomeAssistantError(f"Urlaubsmodus beenden fehlgeschlagen: {exc}") from exc
+            await self.entity_description.turn_off_fn(self._client)
+        except JudoApiError as exc:
+            raise HomeAssistantError(
+                f"{self.entity_description.turn_off_label} fehlgeschlagen: {exc}"
+            ) from exc
+        self._attr_is_on = False
+        self.async_write_ha_state()